@@ -9,10 +9,19 @@ import random
 import threading
 import os
 from datetime import datetime, timedelta
-from http.server import HTTPServer, BaseHTTPRequestHandler
+from http.server import ThreadingHTTPServer, BaseHTTPRequestHandler
 import socket
 
+STREAM_INTERVAL = 3  # seconds between pushed dashboard updates
+
+# Latest serialized SSE frame shared by every connected dashboard
+_stream_lock = threading.Lock()
+_stream_frame = (0.0, b'')
+
 class CloudAgriMindHandler(BaseHTTPRequestHandler):
+    # Keep connections open so a browser reuses one socket across polls
+    protocol_version = 'HTTP/1.1'
+    
     def log_message(self, format, *args):
         """Clean logging with timestamps"""
         timestamp = datetime.now().strftime('%H:%M:%S')
@@ -23,6 +32,8 @@ class CloudAgriMindHandler(BaseHTTPRequestHandler):
         try:
             if self.path == '/':
                 self.serve_dashboard()
+            elif self.path == '/api/stream':
+                self.stream_updates()
             elif self.path.startswith('/api/'):
                 self.handle_api()
             elif self.path == '/health':
@@ -35,15 +46,17 @@ class CloudAgriMindHandler(BaseHTTPRequestHandler):
     
     def health_check(self):
         """Health check endpoint for Cloud Run"""
-        self.send_response(200)
-        self.send_header('Content-type', 'application/json')
-        self.end_headers()
         health = {
             'status': 'healthy',
             'timestamp': datetime.now().isoformat(),
             'service': 'agrimind-dashboard'
         }
-        self.wfile.write(json.dumps(health).encode())
+        body = json.dumps(health).encode()
+        self.send_response(200)
+        self.send_header('Content-type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
     
     def serve_dashboard(self):
         """Serve enhanced dashboard HTML"""
@@ -73,6 +86,8 @@ class CloudAgriMindHandler(BaseHTTPRequestHandler):
                 data = self.get_alerts_data()
             elif self.path == '/api/predictions':
                 data = self.get_predictions_data()
+            elif self.path == '/api/bulk':
+                data = self.get_snapshot()
             else:
                 data = {'error': 'Unknown endpoint'}
             
@@ -93,6 +108,46 @@ class CloudAgriMindHandler(BaseHTTPRequestHandler):
             self.end_headers()
             self.wfile.write(error_response.encode('utf-8'))
     
+    def stream_updates(self):
+        """Push dashboard snapshots over Server-Sent Events"""
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/event-stream')
+        self.send_header('Cache-Control', 'no-cache')
+        self.send_header('Connection', 'keep-alive')
+        self.end_headers()
+        # The stream never ends, so the socket cannot be reused afterwards
+        self.close_connection = True
+        
+        try:
+            while True:
+                self.wfile.write(self.get_stream_frame())
+                self.wfile.flush()
+                time.sleep(STREAM_INTERVAL)
+        except (BrokenPipeError, ConnectionResetError):
+            pass
+    
+    def get_stream_frame(self):
+        """Serialize one snapshot per tick and share it across streams"""
+        global _stream_frame
+        with _stream_lock:
+            built_at, frame = _stream_frame
+            now = time.monotonic()
+            if now - built_at >= STREAM_INTERVAL:
+                frame = b'data: ' + json.dumps(self.get_snapshot()).encode('utf-8') + b'\n\n'
+                _stream_frame = (now, frame)
+            return frame
+    
+    def get_snapshot(self):
+        """All dashboard payloads in a single object"""
+        return {
+            'status': self.get_system_status(),
+            'agents': self.get_agents_data(),
+            'transactions': self.get_transactions_data(),
+            'analytics': self.get_analytics_data(),
+            'alerts': self.get_alerts_data(),
+            'predictions': self.get_predictions_data()
+        }
+    
     def get_system_status(self):
         """Enhanced system status with more metrics"""
         return {
@@ -662,7 +717,7 @@ class CloudAgriMindHandler(BaseHTTPRequestHandler):
         </div>
         
         <div class="footer">
-            🌐 Deployed on Google Cloud | 🔄 Auto-refresh: 3 seconds | 🏆 Hackathon Ready
+            🌐 Deployed on Google Cloud | 🔄 Live updates: every 3 seconds | 🏆 Hackathon Ready
         </div>
     </div>
 
@@ -671,6 +726,9 @@ class CloudAgriMindHandler(BaseHTTPRequestHandler):
             constructor() {
                 this.updateInterval = 3000;
                 this.chart = null;
+                this.timer = null;
+                this.inFlight = null;
+                this.timeFormat = new Intl.DateTimeFormat([], {hour: '2-digit', minute: '2-digit', second: '2-digit'});
                 console.log('🌐 Cloud AgriMind Dashboard initialized');
                 this.init();
             }
@@ -679,38 +737,55 @@ class CloudAgriMindHandler(BaseHTTPRequestHandler):
                 console.log('⚡ Starting cloud dashboard...');
                 await this.updateAll();
                 this.initChart();
-                this.startAutoUpdate();
+                if (window.EventSource) {
+                    this.startStream();
+                } else {
+                    this.startAutoUpdate();
+                }
             }
             
             async updateAll() {
                 console.log('🔄 Updating all data...');
+                // Cancel any fetches still pending from an earlier tick
+                if (this.inFlight) this.inFlight.abort();
+                const controller = new AbortController();
+                this.inFlight = controller;
+                
                 try {
-                    await Promise.all([
-                        this.updateSystemStatus(),
-                        this.updateAgents(),
-                        this.updateTransactions(),
-                        this.updateAnalytics(),
-                        this.updateAlerts(),
-                        this.updatePredictions()
-                    ]);
+                    const snapshot = await this.fetchData('bulk', controller.signal);
+                    if (!snapshot || controller.signal.aborted) return;
+                    this.applyUpdate(snapshot);
                 } catch (error) {
                     console.error('❌ Update error:', error);
                 }
             }
             
-            async fetchData(endpoint) {
+            applyUpdate(snapshot) {
+                this.updateSystemStatus(snapshot.status);
+                this.updateAgents(snapshot.agents);
+                this.updateTransactions(snapshot.transactions);
+                this.updateAnalytics(snapshot.analytics);
+                this.updateAlerts(snapshot.alerts);
+                this.updatePredictions(snapshot.predictions);
+            }
+            
+            async fetchData(endpoint, signal) {
                 try {
-                    const response = await fetch(`/api/${endpoint}`);
+                    const response = await fetch(`/api/${endpoint}`, {
+                        signal,
+                        cache: 'no-store',
+                        headers: {'Accept': 'application/json'}
+                    });
                     if (!response.ok) throw new Error(`HTTP ${response.status}`);
                     return await response.json();
                 } catch (error) {
+                    if (error.name === 'AbortError') return null;
                     console.error(`❌ Error fetching ${endpoint}:`, error);
                     return null;
                 }
             }
             
-            async updateSystemStatus() {
-                const data = await this.fetchData('status');
+            updateSystemStatus(data) {
                 if (!data) return;
                 
                 const container = document.getElementById('status-overview');
@@ -743,8 +818,7 @@ class CloudAgriMindHandler(BaseHTTPRequestHandler):
                 `;
             }
             
-            async updateAgents() {
-                const data = await this.fetchData('agents');
+            updateAgents(data) {
                 if (!data) return;
                 
                 const container = document.getElementById('agents-container');
@@ -789,8 +863,7 @@ class CloudAgriMindHandler(BaseHTTPRequestHandler):
                 });
             }
             
-            async updateTransactions() {
-                const data = await this.fetchData('transactions');
+            updateTransactions(data) {
                 if (!data) return;
                 
                 const container = document.getElementById('transactions-container');
@@ -800,7 +873,7 @@ class CloudAgriMindHandler(BaseHTTPRequestHandler):
                 data.transactions.slice(0, 6).forEach(tx => {
                     const txDiv = document.createElement('div');
                     txDiv.className = 'transaction-item';
-                    const time = new Date(tx.timestamp).toLocaleTimeString();
+                    const time = this.timeFormat.format(new Date(tx.timestamp));
                     
                     txDiv.innerHTML = `
                         <div class="item-info">
@@ -816,8 +889,7 @@ class CloudAgriMindHandler(BaseHTTPRequestHandler):
                 });
             }
             
-            async updateAnalytics() {
-                const data = await this.fetchData('analytics');
+            updateAnalytics(data) {
                 if (!data) return;
                 
                 const container = document.getElementById('analytics-container');
@@ -843,8 +915,7 @@ class CloudAgriMindHandler(BaseHTTPRequestHandler):
                 `;
             }
             
-            async updateAlerts() {
-                const data = await this.fetchData('alerts');
+            updateAlerts(data) {
                 if (!data) return;
                 
                 const container = document.getElementById('alerts-container');
@@ -854,7 +925,7 @@ class CloudAgriMindHandler(BaseHTTPRequestHandler):
                 data.alerts.slice(0, 5).forEach(alert => {
                     const alertDiv = document.createElement('div');
                     alertDiv.className = `alert-item ${alert.type}`;
-                    const time = new Date(alert.timestamp).toLocaleTimeString();
+                    const time = this.timeFormat.format(new Date(alert.timestamp));
                     
                     alertDiv.innerHTML = `
                         <div class="item-info">
@@ -869,8 +940,7 @@ class CloudAgriMindHandler(BaseHTTPRequestHandler):
                 });
             }
             
-            async updatePredictions() {
-                const data = await this.fetchData('predictions');
+            updatePredictions(data) {
                 if (!data) return;
                 
                 const container = document.getElementById('predictions-container');
@@ -928,7 +998,7 @@ class CloudAgriMindHandler(BaseHTTPRequestHandler):
             updateChart() {
                 if (!this.chart) return;
                 
-                const now = new Date().toLocaleTimeString();
+                const now = this.timeFormat.format(new Date());
                 const maxPoints = 15;
                 
                 if (this.chart.data.labels.length >= maxPoints) {
@@ -942,11 +1012,28 @@ class CloudAgriMindHandler(BaseHTTPRequestHandler):
                 this.chart.update('none');
             }
             
-            startAutoUpdate() {
-                setInterval(() => {
-                    this.updateAll();
+            startStream() {
+                this.stream = new EventSource('/api/stream');
+                this.stream.onmessage = (event) => {
+                    this.applyUpdate(JSON.parse(event.data));
                     this.updateChart();
-                }, this.updateInterval);
+                };
+                this.stream.onerror = () => {
+                    console.warn('⚠️ Update stream interrupted, reconnecting...');
+                };
+            }
+            
+            startAutoUpdate() {
+                // Schedule the next tick only after the current one settles
+                const loop = async () => {
+                    try {
+                        await this.updateAll();
+                        this.updateChart();
+                    } finally {
+                        this.timer = setTimeout(loop, this.updateInterval);
+                    }
+                };
+                this.timer = setTimeout(loop, this.updateInterval);
             }
         }
         
@@ -969,14 +1056,15 @@ def main():
     host = '0.0.0.0'  # Bind to all interfaces for cloud deployment
     
     try:
-        server = HTTPServer((host, port), CloudAgriMindHandler)
+        server = ThreadingHTTPServer((host, port), CloudAgriMindHandler)
+        server.daemon_threads = True  # Long-lived SSE streams must not block shutdown
         
         print(f"\n✅ Server starting on {host}:{port}")
         print("🎯 Features:")
         print("   • 🌐 Cloud-optimized")
         print("   • 🏥 Health check endpoint")
-        print("   • 📊 6 API endpoints")
-        print("   • ⚡ 3-second updates")
+        print("   • 📊 6 API endpoints + bulk snapshot")
+        print("   • ⚡ 3-second push updates (SSE)")
         print("   • 🧠 Enhanced AI agents")
         print("   • 💹 Smart transactions")
         
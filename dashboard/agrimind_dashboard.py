@@ -4,11 +4,13 @@ Web-based dashboard for monitoring agent activities, transactions, and system he
 """
 
 import asyncio
-import json
 import os
 import sys
+import time
+from array import array
+from collections import deque
 from datetime import datetime, timedelta
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Set, Tuple, TypedDict
 from pathlib import Path
 import logging
 
@@ -18,10 +20,12 @@ sys.path.append(str(project_root))
 
 from fastapi import FastAPI, WebSocket, WebSocketDisconnect, HTTPException
 from fastapi.staticfiles import StaticFiles
-from fastapi.responses import HTMLResponse, FileResponse
+from fastapi.responses import HTMLResponse, FileResponse, ORJSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
 import uvicorn
-from pydantic import BaseModel
+import msgpack
+import numpy as np
+import orjson
 
 # Import AgriMind components
 from agents.base_agent import message_bus, MessageType, AgentType
@@ -31,7 +35,14 @@ from config.config import get_config_manager
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("AgriMind-Dashboard")
 
-app = FastAPI(title="AgriMind Dashboard", description="Real-time farm intelligence monitoring")
+app = FastAPI(
+    title="AgriMind Dashboard",
+    description="Real-time farm intelligence monitoring",
+    default_response_class=ORJSONResponse
+)
+
+# Endpoints return ORJSONResponse directly so FastAPI skips its jsonable_encoder
+# pass; orjson serializes datetimes, enums and numpy scalars natively
 
 # CORS middleware for development
 app.add_middleware(
@@ -42,43 +53,82 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
-# Data models
-class AgentStatus(BaseModel):
+# Data models: shapes of the plain dicts sent to clients (no runtime validation)
+class AgentStatus(TypedDict):
     agent_id: str
     agent_type: str
     online: bool
     balance: float
     message_queue_length: int
     transactions_count: int
-    last_activity: str
+    last_online_check: str
 
-class SystemMetrics(BaseModel):
+class SystemMetrics(TypedDict):
     total_agents: int
     online_agents: int
     total_transactions: int
     total_messages: int
-    system_uptime: str
-    data_sources_active: int
+    uptime: str
 
-class TransactionData(BaseModel):
+class TransactionData(TypedDict):
     transaction_id: str
     buyer_id: str
     seller_id: str
     item_type: str
     quantity: float
     price: float
-    timestamp: str
+    timestamp: datetime
     status: str
 
+def _msgpack_default(obj: Any) -> Any:
+    """Convert values msgpack can't encode natively for WebSocket frames"""
+    if isinstance(obj, datetime):
+        # Naive local times: send isoformat() strings, as the JSON frames did
+        return obj.isoformat()
+    if isinstance(obj, deque):
+        return list(obj)
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise TypeError(f"Cannot serialize {type(obj).__name__} for WebSocket")
+
+def pack_message(message: Dict[str, Any]) -> bytes:
+    """Encode a WebSocket message as a MessagePack binary frame"""
+    return msgpack.packb(message, use_bin_type=True, default=_msgpack_default)
+
+# Wire fields of a transaction, in the order they are sent to clients
+TRANSACTION_FIELDS = (
+    "transaction_id", "buyer_id", "seller_id", "item_type",
+    "quantity", "price", "timestamp", "status"
+)
+
+# Status fields that never change for an agent; encoded once and reused
+STATIC_AGENT_FIELDS = ("agent_id", "agent_type")
+
 # Global state
-connected_websockets: List[WebSocket] = []
+connected_websockets: Set[WebSocket] = set()
 dashboard_data = {
     "agents": {},
     "transactions": [],
     "messages": [],
     "system_metrics": {},
-    "alerts": []
+    "alerts": deque(maxlen=50)  # Keeps only the last 50 alerts
 }
+# Encoded snapshot message, reset to None whenever dashboard_data changes
+encoded_dashboard: Optional[bytes] = None
+# Shallow copy of dashboard_data as of the last broadcast, used for patches
+last_sent: Dict[str, Any] = {}
+
+# Per-tick view of the agents, shared by the broadcaster and REST endpoints
+SNAPSHOT_TTL = 0.5  # seconds
+agent_snapshot_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+# '"id":{"agent_id":...,"agent_type":...' per agent, rebuilt when the fleet changes
+agent_static_json: Dict[str, bytes] = {}
+
+# Broadcast scheduling: producers set the event, dashboard_updater coalesces
+BROADCAST_DEBOUNCE = 0.1  # seconds to gather a burst of changes
+BROADCAST_HEARTBEAT = 2  # seconds; agents don't signal changes, so refresh anyway
+broadcast_requested = asyncio.Event()
+clients_present = asyncio.Event()  # Set while at least one WebSocket is connected
 
 # Dashboard HTML page
 DASHBOARD_HTML = """
@@ -89,6 +139,7 @@ DASHBOARD_HTML = """
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
     <title>🌾 AgriMind Dashboard</title>
     <script src="https://cdn.jsdelivr.net/npm/chart.js"></script>
+    <script src="https://cdn.jsdelivr.net/npm/@msgpack/msgpack@2.8.0/dist.es5+umd/msgpack.min.js"></script>
     <script src="https://cdn.tailwindcss.com"></script>
     <style>
         .agent-card { transition: all 0.3s ease; }
@@ -186,6 +237,7 @@ DASHBOARD_HTML = """
 
     <script>
         let socket = null;
+        let dashboardState = {};
         let agentActivityChart = null;
         let transactionChart = null;
 
@@ -199,6 +251,7 @@ DASHBOARD_HTML = """
         function connectWebSocket() {
             const wsUrl = `ws://${window.location.host}/ws`;
             socket = new WebSocket(wsUrl);
+            socket.binaryType = 'arraybuffer';
 
             socket.onopen = function(event) {
                 console.log('Connected to AgriMind Dashboard');
@@ -207,8 +260,9 @@ DASHBOARD_HTML = """
             };
 
             socket.onmessage = function(event) {
-                const data = JSON.parse(event.data);
-                updateDashboard(data);
+                const message = MessagePack.decode(new Uint8Array(event.data));
+                applyMessage(message);
+                updateDashboard(dashboardState);
                 document.getElementById('last-update').textContent = new Date().toLocaleTimeString();
             };
 
@@ -272,6 +326,21 @@ DASHBOARD_HTML = """
             });
         }
 
+        // Merge a snapshot or patch message into the local state mirror
+        function applyMessage(message) {
+            if (message.type === 'snapshot') {
+                dashboardState = message.data;
+                return;
+            }
+
+            const { agents, ...changed } = message.data;
+            Object.assign(dashboardState, changed);
+            if (agents || message.removed_agents.length) {
+                dashboardState.agents = { ...dashboardState.agents, ...agents };
+                message.removed_agents.forEach(agentId => delete dashboardState.agents[agentId]);
+            }
+        }
+
         // Update dashboard with new data
         function updateDashboard(data) {
             updateMetrics(data.system_metrics);
@@ -435,30 +504,33 @@ async def get_dashboard():
 async def websocket_endpoint(websocket: WebSocket):
     """WebSocket endpoint for real-time updates"""
     await websocket.accept()
-    connected_websockets.append(websocket)
+    connected_websockets.add(websocket)
+    clients_present.set()
     
     try:
         # Send initial data
-        await websocket.send_text(json.dumps(dashboard_data))
+        await websocket.send_bytes(encode_dashboard_data())
         
         # Keep connection alive
         while True:
             await asyncio.sleep(1)  # Wait for updates
             
     except WebSocketDisconnect:
-        connected_websockets.remove(websocket)
+        drop_client(websocket)
     except Exception as e:
         logger.error(f"WebSocket error: {e}")
-        if websocket in connected_websockets:
-            connected_websockets.remove(websocket)
+        drop_client(websocket)
+
+def drop_client(websocket: WebSocket):
+    """Forget a WebSocket; the updater idles once the last one is gone"""
+    connected_websockets.discard(websocket)
+    if not connected_websockets:
+        clients_present.clear()
 
 @app.get("/api/agents")
 async def get_agents():
     """Get all agent statuses"""
-    agents = {}
-    for agent_id, agent in message_bus.agents.items():
-        agents[agent_id] = agent.get_status()
-    return agents
+    return Response(content=encode_agents(agent_snapshot()["agents"]), media_type="application/json")
 
 @app.get("/api/system/stats")
 async def get_system_stats():
@@ -466,43 +538,24 @@ async def get_system_stats():
     stats = message_bus.get_agent_stats()
     
     # Add transaction stats
-    total_transactions = 0
-    for agent in message_bus.agents.values():
-        total_transactions += len(agent.transactions)
-    
     stats.update({
-        "total_transactions": total_transactions,
+        "total_transactions": agent_snapshot()["total_transactions"],
         "uptime": "N/A",  # Would calculate from start time
         "data_sources_active": 4  # Mock for now
     })
     
-    return stats
+    return ORJSONResponse(stats)
 
 @app.get("/api/transactions")
 async def get_transactions():
     """Get recent transactions"""
-    transactions = []
-    for agent in message_bus.agents.values():
-        for transaction in agent.transactions.values():
-            transactions.append({
-                "transaction_id": transaction.id,
-                "buyer_id": transaction.buyer_id,
-                "seller_id": transaction.seller_id,
-                "item_type": transaction.item_type,
-                "quantity": transaction.quantity,
-                "price": transaction.price,
-                "timestamp": transaction.timestamp.isoformat(),
-                "status": transaction.status
-            })
-    
-    # Sort by timestamp, most recent first
-    transactions.sort(key=lambda x: x["timestamp"], reverse=True)
-    return transactions[:20]  # Return last 20 transactions
+    # Return last 20 transactions; orjson writes the datetimes as ISO strings
+    return ORJSONResponse(latest_transactions(agent_snapshot()["transactions"], 20))
 
 @app.get("/api/marketplace")
 async def get_marketplace():
     """Get marketplace data"""
-    return message_bus.get_marketplace_data()
+    return ORJSONResponse(message_bus.get_marketplace_data())
 
 @app.post("/api/alerts")
 async def create_alert(title: str, message: str, severity: str = "info"):
@@ -514,59 +567,142 @@ async def create_alert(title: str, message: str, severity: str = "info"):
         "timestamp": datetime.now().isoformat()
     }
     
+    global encoded_dashboard
     dashboard_data["alerts"].append(alert)
+    encoded_dashboard = None
     
-    # Keep only last 50 alerts
-    if len(dashboard_data["alerts"]) > 50:
-        dashboard_data["alerts"] = dashboard_data["alerts"][-50:]
+    # Broadcast to all connected clients on the next coalesced update
+    broadcast_requested.set()
     
-    # Broadcast to all connected clients
-    await broadcast_update()
+    return ORJSONResponse({"status": "success", "alert": alert})
+
+def agent_snapshot() -> Dict[str, Any]:
+    """Walk the agents once for statuses, transaction columns and totals"""
+    global agent_snapshot_cache
+    now = time.monotonic()
+    if agent_snapshot_cache is not None and now - agent_snapshot_cache[0] < SNAPSHOT_TTL:
+        return agent_snapshot_cache[1]
     
-    return {"status": "success", "alert": alert}
-
-async def update_dashboard_data():
-    """Update dashboard data from message bus and agents"""
-    # Get agent data
     agents = {}
     total_transactions = 0
+    columns: Dict[str, Any] = {field: [] for field in TRANSACTION_FIELDS}
+    sort_keys = array('d')
     
     for agent_id, agent in message_bus.agents.items():
         agents[agent_id] = agent.get_status()
         total_transactions += len(agent.transactions)
+        for transaction in agent.transactions.values():
+            columns["transaction_id"].append(transaction.id)
+            columns["buyer_id"].append(transaction.buyer_id)
+            columns["seller_id"].append(transaction.seller_id)
+            columns["item_type"].append(transaction.item_type)
+            columns["quantity"].append(transaction.quantity)
+            columns["price"].append(transaction.price)
+            columns["timestamp"].append(transaction.timestamp)
+            columns["status"].append(transaction.status)
+            sort_keys.append(transaction.timestamp.timestamp())
+    
+    columns["sort_key"] = np.frombuffer(sort_keys, dtype=np.float64)
+    
+    snapshot = {
+        "agents": agents,
+        "total_transactions": total_transactions,
+        "transactions": columns
+    }
+    agent_snapshot_cache = (now, snapshot)
+    return snapshot
+
+def encode_agents(agents: Dict[str, AgentStatus]) -> bytes:
+    """JSON-encode agent statuses, reusing each agent's encoded static fields"""
+    global agent_static_json
+    if agent_static_json.keys() != agents.keys():
+        agent_static_json = {
+            agent_id: agent_static_json.get(agent_id) or (
+                orjson.dumps(agent_id) + b":"
+                + orjson.dumps({field: status[field] for field in STATIC_AGENT_FIELDS})[:-1]
+            )
+            for agent_id, status in agents.items()
+        }
+    
+    parts = []
+    for agent_id, status in agents.items():
+        dynamic = orjson.dumps({
+            key: value for key, value in status.items() if key not in STATIC_AGENT_FIELDS
+        })
+        # Splice '{...dynamic}' onto the open static object: ',' + body + '}'
+        parts.append(agent_static_json[agent_id] + (b"," + dynamic[1:] if len(dynamic) > 2 else b"}"))
+    return b"{" + b",".join(parts) + b"}"
+
+def latest_transactions(columns: Dict[str, Any], limit: int) -> List[TransactionData]:
+    """Most recent transactions first; only the returned rows become dicts"""
+    sort_key = columns["sort_key"]
+    if len(sort_key) > limit:
+        # Partial selection: O(N) to find the newest rows, then sort just those
+        candidates = np.argpartition(sort_key, len(sort_key) - limit)[-limit:]
+        order = candidates[np.argsort(sort_key[candidates])[::-1]]
+    else:
+        order = np.argsort(sort_key)[::-1]
+    return [
+        {field: columns[field][i] for field in TRANSACTION_FIELDS}
+        for i in order.tolist()
+    ]
+
+def encode_dashboard_data() -> bytes:
+    """Encode the full snapshot message, reusing the bytes until it changes"""
+    global encoded_dashboard
+    if encoded_dashboard is None:
+        encoded_dashboard = pack_message({"type": "snapshot", "data": dashboard_data})
+    return encoded_dashboard
+
+def compute_patch() -> Dict[str, Any]:
+    """Build a patch message with the fields changed since the last broadcast"""
+    changed: Dict[str, Any] = {}
+    removed_agents: List[str] = []
+    
+    for key, value in dashboard_data.items():
+        previous = last_sent.get(key)
+        if value == previous:
+            continue
+        if key == "agents" and previous is not None:
+            # Agents are diffed per id so one busy agent doesn't resend the fleet
+            changed[key] = {
+                agent_id: status for agent_id, status in value.items()
+                if previous.get(agent_id) != status
+            }
+            removed_agents = [agent_id for agent_id in previous if agent_id not in value]
+        else:
+            changed[key] = value
+    
+    # Copy containers so later in-place edits (e.g. alert appends) show up as changes
+    last_sent.clear()
+    last_sent.update({key: value.copy() for key, value in dashboard_data.items()})
+    
+    return {"type": "patch", "data": changed, "removed_agents": removed_agents}
+
+async def update_dashboard_data():
+    """Update dashboard data from message bus and agents"""
+    global encoded_dashboard
+    # Get agent data
+    snapshot = agent_snapshot()
     
     # Get system metrics
     system_stats = message_bus.get_agent_stats()
-    system_metrics = {
+    system_metrics: SystemMetrics = {
         "total_agents": system_stats.get("total_agents", 0),
         "online_agents": system_stats.get("online_agents", 0),
-        "total_transactions": total_transactions,
+        "total_transactions": snapshot["total_transactions"],
         "total_messages": system_stats.get("total_messages_broadcast", 0),
         "uptime": "N/A"  # Would calculate from start time
     }
     
-    # Get transactions
-    transactions = []
-    for agent in message_bus.agents.values():
-        for transaction in agent.transactions.values():
-            transactions.append({
-                "transaction_id": transaction.id,
-                "buyer_id": transaction.buyer_id,
-                "seller_id": transaction.seller_id,
-                "item_type": transaction.item_type,
-                "quantity": transaction.quantity,
-                "price": transaction.price,
-                "timestamp": transaction.timestamp.isoformat(),
-                "status": transaction.status
-            })
-    
     # Update global dashboard data
     dashboard_data.update({
-        "agents": agents,
+        "agents": snapshot["agents"],
         "system_metrics": system_metrics,
-        "transactions": sorted(transactions, key=lambda x: x["timestamp"], reverse=True)[:50],
+        "transactions": latest_transactions(snapshot["transactions"], 50),
         "messages": []  # Would collect from message bus
     })
+    encoded_dashboard = None
 
 async def broadcast_update():
     """Broadcast dashboard updates to all connected WebSocket clients"""
@@ -575,25 +711,40 @@ async def broadcast_update():
     
     await update_dashboard_data()
     
-    # Send to all connected clients
-    disconnected = []
-    for websocket in connected_websockets:
-        try:
-            await websocket.send_text(json.dumps(dashboard_data))
-        except Exception as e:
-            logger.error(f"Error sending to WebSocket: {e}")
-            disconnected.append(websocket)
+    patch = compute_patch()
+    if not patch["data"] and not patch["removed_agents"]:
+        return  # Nothing changed since the last broadcast
+    
+    # Encode the patch once, then send the same bytes to every client
+    payload = pack_message(patch)
+    
+    # Send to all clients concurrently so one slow socket can't stall the rest
+    clients = list(connected_websockets)
+    results = await asyncio.gather(
+        *(websocket.send_bytes(payload) for websocket in clients),
+        return_exceptions=True
+    )
     
     # Remove disconnected clients
-    for ws in disconnected:
-        connected_websockets.remove(ws)
+    for ws, result in zip(clients, results):
+        if isinstance(result, Exception):
+            logger.error(f"Error sending to WebSocket: {result}")
+            drop_client(ws)
 
 async def dashboard_updater():
-    """Background task to update dashboard periodically"""
+    """Background task that broadcasts on request or every heartbeat"""
     while True:
         try:
+            # Don't walk agents or wake on heartbeats while nobody is watching
+            await clients_present.wait()
+            try:
+                await asyncio.wait_for(broadcast_requested.wait(), timeout=BROADCAST_HEARTBEAT)
+                # Let a burst of requests land before broadcasting once
+                await asyncio.sleep(BROADCAST_DEBOUNCE)
+            except asyncio.TimeoutError:
+                pass
+            broadcast_requested.clear()
             await broadcast_update()
-            await asyncio.sleep(2)  # Update every 2 seconds
         except Exception as e:
             logger.error(f"Dashboard update error: {e}")
             await asyncio.sleep(5)
@@ -618,5 +769,7 @@ if __name__ == "__main__":
         host="127.0.0.1",
         port=8000,
         log_level="info",
-        reload=False
+        reload=False,
+        ws="websockets",
+        ws_per_message_deflate=True  # Dashboard frames repeat the same keys every tick
     )
@@ -4,20 +4,36 @@ Provides safe fallbacks when dataset files or dependencies (like pandas) are mis
 """
 from __future__ import annotations
 
+import copy
+import functools
 import json
+import mmap
 import os
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 try:
+    import numpy as np  # type: ignore
     import pandas as pd  # type: ignore
 except Exception:
+    np = None
     pd = None  # Optional dependency
 
+try:
+    import orjson  # type: ignore
+except Exception:
+    orjson = None  # Optional dependency; falls back to stdlib json
+
 DATASETS_DIR = Path("datasets")
 
+# JSON files at least this large are parsed from a memory map instead of a copy
+MMAP_MIN_BYTES = 1 << 20
+
+# Parsed dataset files keyed by (path, mtime); filters run on the cached result
+_parse_cache: Dict[Tuple[str, float], Any] = {}
+
 
 @dataclass
 class DataSourceInfo:
@@ -34,6 +50,143 @@ def _empty_df() -> Any:
     return pd.DataFrame()
 
 
+@functools.lru_cache(maxsize=1)
+def _dir_snapshot(directory: Path, mtime_ns: int) -> frozenset:
+    """File names in a directory; mtime_ns invalidates on add/remove/rename."""
+    with os.scandir(directory) as entries:
+        return frozenset(entry.name for entry in entries if entry.is_file())
+
+
+def _dataset_files() -> frozenset:
+    try:
+        mtime_ns = DATASETS_DIR.stat().st_mtime_ns
+    except OSError:
+        return frozenset()
+    return _dir_snapshot(DATASETS_DIR, mtime_ns)
+
+
+def _cached_parse(path: Path, parse: Callable[[Path], Any]) -> Any:
+    """Parse a dataset file once per modification time."""
+    key = (str(path), path.stat().st_mtime)
+    if key not in _parse_cache:
+        # Drop entries for older versions of the same file
+        for stale in [k for k in _parse_cache if k[0] == key[0]]:
+            del _parse_cache[stale]
+        _parse_cache[key] = parse(path)
+    return _parse_cache[key]
+
+
+def _filter_recent(df: Any, days_back: int) -> Any:
+    """Rows dated within the last days_back days of a cached, date-parsed frame."""
+    if "date" not in df.columns:
+        return df.copy()
+    # Compare on the backing datetime64 array; NaT never passes, as with pandas
+    cutoff = np.datetime64(datetime.now() - timedelta(days=days_back))
+    return df[df["date"].to_numpy() >= cutoff]
+
+
+def _read_json(path: Path) -> Any:
+    if orjson is not None:
+        # orjson parses the raw UTF-8 bytes without decoding to str first
+        with open(path, "rb") as f:
+            if os.fstat(f.fileno()).st_size < MMAP_MIN_BYTES:
+                return orjson.loads(f.read())
+            # Large files: parse straight from the page cache, no read buffer
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return orjson.loads(view)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def _parse_csv_with_dates(path: Path) -> Any:
+    df = pd.read_csv(path)
+    if "date" in df.columns:
+        df["date"] = pd.to_datetime(df["date"], errors="coerce")
+    return df
+
+
+def _parse_sensor_file(path: Path) -> List[Dict[str, Any]]:
+    data = _read_json(path)
+    readings: List[Dict[str, Any]] = []
+    for item in data if isinstance(data, list) else []:
+        try:
+            dt = datetime.fromisoformat(item.get("date") or item.get("timestamp") or datetime.now().isoformat())
+            readings.append({
+                "date": dt,
+                "soil_moisture": item.get("soil_moisture"),
+                "temperature": item.get("temperature"),
+                "humidity": item.get("humidity"),
+                "pest_index": item.get("pest_index", 0.0),
+                "location": item.get("location", ""),
+            })
+        except Exception:
+            continue
+    return readings
+
+
+def _filter_sensor_readings(
+    records: List[Dict[str, Any]], location_filter: Optional[str], date_range: Optional[Tuple[datetime, datetime]]
+) -> List[Dict[str, Any]]:
+    readings: List[Dict[str, Any]] = []
+    for rec in records:
+        try:
+            if location_filter and location_filter.lower() not in str(rec["location"]).lower():
+                continue
+            if date_range:
+                start, end = date_range
+                if not (start <= rec["date"] <= end):
+                    continue
+            readings.append(rec)
+        except Exception:
+            continue
+    return readings
+
+
+def _parse_sensor_frame(path: Path) -> Any:
+    """Vectorized counterpart of _parse_sensor_file used when pandas is available."""
+    data = _read_json(path)
+    raw = pd.DataFrame(data if isinstance(data, list) else [])
+
+    def column(name: str, default: Any = None) -> Any:
+        if name in raw.columns:
+            return raw[name]
+        return pd.Series([default] * len(raw), index=raw.index, dtype=object)
+
+    dates = column("date")
+    if "timestamp" in raw.columns:
+        dates = dates.fillna(raw["timestamp"])
+    dates = pd.to_datetime(dates.fillna(datetime.now().isoformat()), errors="coerce", format="ISO8601")
+    df = pd.DataFrame({
+        "date": dates,
+        "soil_moisture": column("soil_moisture"),
+        "temperature": column("temperature"),
+        "humidity": column("humidity"),
+        "pest_index": column("pest_index").fillna(0.0),
+        "location": column("location").fillna(""),
+    })
+    # Unparseable dates were skipped record-by-record in the Python path
+    return df[df["date"].notna()]
+
+
+def _filter_sensor_frame(
+    df: Any, location_filter: Optional[str], date_range: Optional[Tuple[datetime, datetime]]
+) -> List[Dict[str, Any]]:
+    if location_filter:
+        df = df[df["location"].astype(str).str.contains(location_filter, case=False, regex=False, na=False)]
+    if date_range:
+        start, end = date_range
+        df = df[(df["date"] >= start) & (df["date"] <= end)]
+    # Keep missing values as None, matching the dict.get() based Python path
+    df = df.astype(object).where(df.notna(), None)
+    return df.to_dict(orient="records")
+
+
+def _parse_resources_file(path: Path) -> Dict[str, Any]:
+    data = _read_json(path)
+    # Expect a dict of farms -> resources; be permissive
+    return data if isinstance(data, dict) else {}
+
+
 def get_dataset_summary() -> Dict[str, str]:
     summary: Dict[str, str] = {}
     expected_files = {
@@ -42,13 +195,14 @@ def get_dataset_summary() -> Dict[str, str]:
         "farm_resources.json": "resources_dataset",
         "market_prices.csv": "market_dataset",
     }
+    present = _dataset_files()
     for filename, label in expected_files.items():
-        path = DATASETS_DIR / filename
-        summary[label] = "Cached" if path.exists() else "Missing"
+        summary[label] = "Cached" if filename in present else "Missing"
     return summary
 
 
 def clear_dataset_cache() -> int:
+    _parse_cache.clear()
     # Remove pickled caches produced by agents in data/ directory
     data_dir = Path("data")
     removed = 0
@@ -74,17 +228,12 @@ def load_weather_data(location_filter: Optional[str] = None, days_back: int = 30
         confidence=0.0,
     )
     path = DATASETS_DIR / "weather_data_tehsil.csv"
-    if not path.exists() or pd is None:
+    if path.name not in _dataset_files() or pd is None:
         return _empty_df(), src
 
     try:
-        df = pd.read_csv(path)
-        # Normalize common columns if present
         # Expect columns like: date, location, temperature, humidity, precipitation
-        if "date" in df.columns:
-            df["date"] = pd.to_datetime(df["date"], errors="coerce")
-            cutoff = pd.Timestamp(datetime.now() - timedelta(days=days_back))
-            df = df[df["date"] >= cutoff]
+        df = _filter_recent(_cached_parse(path, _parse_csv_with_dates), days_back)
         if location_filter and "location" in df.columns:
             df = df[df["location"].str.contains(location_filter, case=False, na=False)]
 
@@ -110,33 +259,14 @@ def load_sensor_data(location_filter: Optional[str] = None, date_range: Optional
         record_count=0,
         confidence=0.0,
     )
-    if not path.exists():
+    if path.name not in _dataset_files():
         return [], src
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        readings: List[Dict[str, Any]] = []
-        for item in data if isinstance(data, list) else []:
-            try:
-                dt = datetime.fromisoformat(item.get("date") or item.get("timestamp") or datetime.now().isoformat())
-                rec = {
-                    "date": dt,
-                    "soil_moisture": item.get("soil_moisture"),
-                    "temperature": item.get("temperature"),
-                    "humidity": item.get("humidity"),
-                    "pest_index": item.get("pest_index", 0.0),
-                    "location": item.get("location", ""),
-                }
-                if location_filter and location_filter.lower() not in str(rec["location"]).lower():
-                    continue
-                if date_range:
-                    start, end = date_range
-                    if not (start <= rec["date"] <= end):
-                        continue
-                readings.append(rec)
-            except Exception:
-                continue
+        if pd is not None:
+            readings = _filter_sensor_frame(_cached_parse(path, _parse_sensor_frame), location_filter, date_range)
+        else:
+            readings = _filter_sensor_readings(_cached_parse(path, _parse_sensor_file), location_filter, date_range)
 
         src = DataSourceInfo(
             source_type="dataset",
@@ -160,14 +290,12 @@ def load_resources_data() -> Tuple[Dict[str, Any], DataSourceInfo]:
         record_count=0,
         confidence=0.0,
     )
-    if not path.exists():
+    if path.name not in _dataset_files():
         return {}, src
 
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        # Expect a dict of farms -> resources; be permissive
-        farms = data if isinstance(data, dict) else {}
+        # Deep copy: callers may edit the nested farm dicts the cache still holds
+        farms = copy.deepcopy(_cached_parse(path, _parse_resources_file))
         src = DataSourceInfo(
             source_type="dataset",
             source_name=path.name,
@@ -180,8 +308,29 @@ def load_resources_data() -> Tuple[Dict[str, Any], DataSourceInfo]:
         return {}, src
 
 
-def load_market_data(days_back: int = 60) -> Tuple[Any, DataSourceInfo]:
-    """Load market prices from market_prices.csv if available."""
+def _aggregate_market_prices(df):
+    """Per-commodity mean/min/max/last of the average price, in one groupby pass."""
+    if df.empty or not {"commodity", "avg_price_pkr_per_40kg"} <= set(df.columns):
+        return _empty_df()
+    if "date" in df.columns:
+        # Stable sort so "last" is the most recent price per commodity
+        df = df.sort_values("date", kind="stable")
+    # Category codes group on integers instead of hashing every commodity string
+    commodity = df["commodity"].astype("category")
+    return (
+        df["avg_price_pkr_per_40kg"]
+        .groupby(commodity, sort=False, observed=True)
+        .agg(["mean", "min", "max", "last"])
+        .reset_index()
+    )
+
+
+def load_market_data(days_back: int = 60, aggregate: bool = False) -> Tuple[Any, DataSourceInfo]:
+    """Load market prices from market_prices.csv if available.
+
+    With aggregate=True, returns one row per commodity (mean/min/max/last
+    average price) instead of the raw price rows.
+    """
     src = DataSourceInfo(
         source_type="error",
         source_name="market_prices.csv",
@@ -190,15 +339,13 @@ def load_market_data(days_back: int = 60) -> Tuple[Any, DataSourceInfo]:
         confidence=0.0,
     )
     path = DATASETS_DIR / "market_prices.csv"
-    if not path.exists() or pd is None:
+    if path.name not in _dataset_files() or pd is None:
         return _empty_df(), src
 
     try:
-        df = pd.read_csv(path)
-        if "date" in df.columns:
-            df["date"] = pd.to_datetime(df["date"], errors="coerce")
-            cutoff = pd.Timestamp(datetime.now() - timedelta(days=days_back))
-            df = df[df["date"] >= cutoff]
+        df = _filter_recent(_cached_parse(path, _parse_csv_with_dates), days_back)
+        if aggregate:
+            df = _aggregate_market_prices(df)
         src = DataSourceInfo(
             source_type="dataset",
             source_name=path.name,
@@ -5,6 +5,7 @@ Provides functions to load official hackathon datasets for all agent types.
 
 from .dataset_loaders import (
     load_sensor_data,
+    load_sensor_data_df,
     load_weather_data,
     load_resources_data,
     load_market_data,
@@ -15,6 +16,7 @@ from .dataset_loaders import (
 
 __all__ = [
     "load_sensor_data",
+    "load_sensor_data_df",
     "load_weather_data", 
     "load_resources_data",
     "load_market_data",
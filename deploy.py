@@ -3,24 +3,39 @@
 AgriMind Deployment Script
 Automated deployment to Google Cloud Platform
 """
+import shlex
+import shutil
 import subprocess
 import sys
 import os
 import json
 from datetime import datetime
 
+def resolve_argv(cmd):
+    """Resolve the executable via PATH (incl. Windows .cmd shims like gcloud.cmd)"""
+    return [shutil.which(cmd[0]) or cmd[0], *cmd[1:]]
+
 def run_command(cmd, description=""):
-    """Run command and handle errors"""
+    """Run an argv list without a shell, streaming its output as it arrives"""
     print(f"🔄 {description}")
-    print(f"Running: {cmd}")
+    print(f"Running: {shlex.join(cmd)}")
     
     try:
-        result = subprocess.run(cmd, shell=True, capture_output=True, text=True)
-        if result.returncode != 0:
-            print(f"❌ Error: {result.stderr}")
+        with subprocess.Popen(
+            resolve_argv(cmd),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            bufsize=1,
+            text=True
+        ) as proc:
+            # Live progress for long uploads; nothing is buffered in memory
+            for line in proc.stdout:
+                print(line, end="")
+        if proc.returncode != 0:
+            print(f"❌ Error: exit code {proc.returncode}")
             return False
         else:
-            print(f"✅ Success: {result.stdout}")
+            print("✅ Success")
             return True
     except Exception as e:
         print(f"❌ Exception: {e}")
@@ -31,9 +46,9 @@ def check_prerequisites():
     print("🔍 Checking prerequisites...")
     
     tools = {
-        'gcloud': 'gcloud --version',
-        'docker': 'docker --version',
-        'git': 'git --version'
+        'gcloud': ['gcloud', '--version'],
+        'docker': ['docker', '--version'],
+        'git': ['git', '--version']
     }
     
     for tool, cmd in tools.items():
@@ -48,15 +63,19 @@ def setup_gcloud():
     print("🔐 Setting up Google Cloud authentication...")
     
     # Check if already authenticated
-    result = subprocess.run("gcloud auth list", shell=True, capture_output=True, text=True)
-    if "ACTIVE" not in result.stdout:
+    try:
+        result = subprocess.run(resolve_argv(['gcloud', 'auth', 'list']), capture_output=True, text=True)
+        active = "ACTIVE" in result.stdout
+    except OSError:
+        active = False
+    if not active:
         print("🔑 Please authenticate with Google Cloud:")
-        run_command("gcloud auth login", "Authenticating with Google Cloud")
+        run_command(['gcloud', 'auth', 'login'], "Authenticating with Google Cloud")
     
     # Set project
     project_id = input("Enter your Google Cloud Project ID: ").strip()
     if project_id:
-        run_command(f"gcloud config set project {project_id}", "Setting project")
+        run_command(['gcloud', 'config', 'set', 'project', project_id], "Setting project")
         return project_id
     else:
         print("❌ Project ID is required")
@@ -70,19 +89,19 @@ def deploy_to_cloud_run(project_id):
     region = "us-central1"
     
     # Build and deploy
-    cmd = f"""
-    gcloud run deploy {service_name} \
-        --source . \
-        --platform managed \
-        --region {region} \
-        --allow-unauthenticated \
-        --memory 1Gi \
-        --cpu 1 \
-        --concurrency 100 \
-        --timeout 300 \
-        --max-instances 10 \
-        --port 8080
-    """
+    cmd = [
+        'gcloud', 'run', 'deploy', service_name,
+        '--source', '.',
+        '--platform', 'managed',
+        '--region', region,
+        '--allow-unauthenticated',
+        '--memory', '1Gi',
+        '--cpu', '1',
+        '--concurrency', '100',
+        '--timeout', '300',
+        '--max-instances', '10',
+        '--port', '8080'
+    ]
     
     if run_command(cmd, "Deploying to Cloud Run"):
         print(f"🎉 Deployment successful!")
@@ -96,11 +115,11 @@ def deploy_to_app_engine():
     """Deploy to Google App Engine"""
     print("🚀 Deploying to Google App Engine...")
     
-    cmd = "gcloud app deploy app.yaml --quiet"
+    cmd = ['gcloud', 'app', 'deploy', 'app.yaml', '--quiet']
     
     if run_command(cmd, "Deploying to App Engine"):
         print(f"🎉 Deployment successful!")
-        run_command("gcloud app browse", "Opening deployed application")
+        run_command(['gcloud', 'app', 'browse'], "Opening deployed application")
         return True
     else:
         return False
@@ -7,13 +7,17 @@ import asyncio
 import json
 import math
 import time
-from datetime import datetime, timedelta
+from collections import defaultdict, deque
+from datetime import datetime
 from typing import Dict, List, Optional, Any, Tuple
 from dataclasses import dataclass, asdict
 from pathlib import Path
 import logging
 import statistics
 import sys
+from itertools import islice
+
+import numpy as np
 
 # Add project root to path
 project_root = Path(__file__).parent.parent
@@ -61,6 +65,42 @@ class AgentEfficiencyReport:
     profitability_score: float
     recommendations: List[str]
 
+class ColumnRing:
+    """
+    Fixed-size history kept as parallel numpy columns (one array per field)
+    New rows overwrite the oldest once the ring is full
+    """
+    
+    def __init__(self, capacity: int, **dtypes):
+        self.capacity = capacity
+        self.head = 0  # Next slot to overwrite
+        self.count = 0
+        for name, dtype in dtypes.items():
+            setattr(self, name, np.empty(capacity, dtype=dtype))
+    
+    def __len__(self) -> int:
+        return self.count
+    
+    def append(self, **values) -> Optional[Dict[str, Any]]:
+        """Write one row at the head; returns the row it overwrote, if any"""
+        evicted = None
+        if self.count == self.capacity:
+            evicted = {name: getattr(self, name)[self.head].item() for name in values}
+        for name, value in values.items():
+            getattr(self, name)[self.head] = value
+        self.head = (self.head + 1) % self.capacity
+        self.count = min(self.count + 1, self.capacity)
+        return evicted
+    
+    def column(self, name: str) -> np.ndarray:
+        """Filled part of a column, in slot order"""
+        return getattr(self, name)[:self.count]
+    
+    def recent(self, name: str, n: int) -> np.ndarray:
+        """Last n values of a column, oldest first"""
+        slots = np.arange(self.head - min(n, self.count), self.head) % self.capacity
+        return getattr(self, name)[slots]
+
 class AgriMindEvaluator:
     """
     Comprehensive system evaluator for AgriMind
@@ -68,14 +108,40 @@ class AgriMindEvaluator:
     """
     
     def __init__(self):
-        self.metrics_history: List[PerformanceMetric] = []
-        self.system_snapshots: List[SystemSnapshot] = []
+        # Bounded histories: appending past maxlen drops the oldest entry
+        self.metrics_history: deque = deque(maxlen=10000)
+        self.system_snapshots: deque = deque(maxlen=1000)
         self.evaluation_start_time = datetime.now()
         self.benchmark_data = {}
         
-        # Performance tracking
-        self.response_times = []
-        self.transaction_times = []
+        # Performance tracking, as numpy columns; agent ids and transaction
+        # types are stored as small ints from these indexes
+        self._agent_index: Dict[str, int] = {}
+        self._type_index: Dict[str, int] = {}
+        self.response_times = ColumnRing(
+            10000, duration=np.float64, agent_idx=np.int32, ts=np.float64
+        )
+        self.transaction_times = ColumnRing(
+            10000, type_idx=np.int32, duration=np.float64, success=np.bool_,
+            buyer_idx=np.int32, seller_idx=np.int32, value=np.float64, ts=np.float64
+        )
+        # Lifetime count; transaction_times only holds the latest 10000
+        self._transactions_recorded = 0
+        
+        # Running per-agent totals over the same windows, keyed by agent
+        # index, so reports don't rescan the histories; rows leaving a
+        # ring are subtracted back out
+        self._agent_resp_sum: Dict[int, float] = defaultdict(float)
+        self._agent_resp_count: Dict[int, int] = defaultdict(int)
+        self._agent_txn_count: Dict[int, int] = defaultdict(int)
+        self._agent_txn_success: Dict[int, int] = defaultdict(int)
+        self._agent_income: Dict[int, float] = defaultdict(float)
+        self._agent_expenses: Dict[int, float] = defaultdict(float)
+        
+        # Trading partners and interactions per agent id, all-time like
+        # collaboration_matrix
+        self._agent_partners: Dict[str, set] = defaultdict(set)
+        self._agent_interactions: Dict[str, int] = defaultdict(int)
         self.error_counts = {"critical": 0, "warning": 0, "info": 0}
         
         # Efficiency tracking
@@ -111,6 +177,11 @@ class AgriMindEvaluator:
             }
         }
     
+    @staticmethod
+    def _intern(index: Dict[str, int], key: str) -> int:
+        """Map a string to a small int for the numpy columns"""
+        return index.setdefault(key, len(index))
+    
     def record_metric(
         self, 
         name: str, 
@@ -131,19 +202,16 @@ class AgriMindEvaluator:
             details=details
         )
         self.metrics_history.append(metric)
-        
-        # Keep only last 10000 metrics to prevent memory issues
-        if len(self.metrics_history) > 10000:
-            self.metrics_history = self.metrics_history[-5000:]
     
     def record_response_time(self, operation: str, duration: float, agent_id: str):
         """Record operation response time"""
-        self.response_times.append({
-            "operation": operation,
-            "duration": duration,
-            "agent_id": agent_id,
-            "timestamp": datetime.now()
-        })
+        agent_idx = self._intern(self._agent_index, agent_id)
+        evicted = self.response_times.append(duration=duration, agent_idx=agent_idx, ts=time.time())
+        self._agent_resp_sum[agent_idx] += duration
+        self._agent_resp_count[agent_idx] += 1
+        if evicted:
+            self._agent_resp_sum[evicted["agent_idx"]] -= evicted["duration"]
+            self._agent_resp_count[evicted["agent_idx"]] -= 1
         
         # Track agent activity
         if agent_id not in self.agent_activity_log:
@@ -173,15 +241,28 @@ class AgriMindEvaluator:
         value: float
     ):
         """Record transaction metrics"""
-        self.transaction_times.append({
-            "type": transaction_type,
-            "duration": duration,
-            "success": success,
-            "buyer_id": buyer_id,
-            "seller_id": seller_id,
-            "value": value,
-            "timestamp": datetime.now()
-        })
+        self._transactions_recorded += 1
+        buyer_idx = self._intern(self._agent_index, buyer_id)
+        seller_idx = self._intern(self._agent_index, seller_id)
+        evicted = self.transaction_times.append(
+            type_idx=self._intern(self._type_index, transaction_type),
+            duration=duration,
+            success=success,
+            buyer_idx=buyer_idx,
+            seller_idx=seller_idx,
+            value=value,
+            ts=time.time()
+        )
+        self._tally_transaction(buyer_idx, seller_idx, success, value, 1)
+        if evicted:
+            self._tally_transaction(
+                evicted["buyer_idx"], evicted["seller_idx"], evicted["success"], evicted["value"], -1
+            )
+        
+        self._agent_partners[buyer_id].add(seller_id)
+        self._agent_partners[seller_id].add(buyer_id)
+        self._agent_interactions[buyer_id] += 1
+        self._agent_interactions[seller_id] += 1
         
         # Update collaboration matrix
         if buyer_id not in self.collaboration_matrix:
@@ -205,6 +286,17 @@ class AgriMindEvaluator:
             }
         )
     
+    def _tally_transaction(self, buyer_idx: int, seller_idx: int, success: bool, value: float, sign: int):
+        """Add (sign=1) or remove (sign=-1) a transaction from the per-agent totals"""
+        for agent_idx in {buyer_idx, seller_idx}:
+            self._agent_txn_count[agent_idx] += sign
+            self._agent_txn_success[agent_idx] += sign * success
+        
+        # A trade with itself counts as income only
+        self._agent_income[seller_idx] += sign * value
+        if buyer_idx != seller_idx:
+            self._agent_expenses[buyer_idx] += sign * value
+    
     def record_error(self, severity: str, message: str, agent_id: Optional[str] = None):
         """Record system errors"""
         if severity in self.error_counts:
@@ -227,10 +319,8 @@ class AgriMindEvaluator:
         # Calculate metrics
         avg_response_time = 0.0
         if self.response_times:
-            recent_responses = [
-                r["duration"] for r in self.response_times[-100:]  # Last 100 operations
-            ]
-            avg_response_time = statistics.mean(recent_responses) if recent_responses else 0.0
+            recent = self.response_times.recent("duration", 100)  # Last 100 operations
+            avg_response_time = float(recent.mean())
         
         success_rate = self._calculate_current_success_rate()
         data_freshness = self._calculate_data_freshness_score()
@@ -240,7 +330,7 @@ class AgriMindEvaluator:
             timestamp=datetime.now(),
             total_agents=agent_stats.get("total_agents", 0),
             online_agents=agent_stats.get("online_agents", 0),
-            total_transactions=len(self.transaction_times),
+            total_transactions=self._transactions_recorded,
             total_messages=agent_stats.get("total_messages_broadcast", 0),
             system_load=system_load,
             response_time_avg=avg_response_time,
@@ -250,10 +340,6 @@ class AgriMindEvaluator:
         
         self.system_snapshots.append(snapshot)
         
-        # Keep only last 1000 snapshots
-        if len(self.system_snapshots) > 1000:
-            self.system_snapshots = self.system_snapshots[-500:]
-        
         return snapshot
     
     def _calculate_current_success_rate(self) -> float:
@@ -261,12 +347,8 @@ class AgriMindEvaluator:
         if not self.transaction_times:
             return 1.0
         
-        recent_transactions = self.transaction_times[-100:]  # Last 100 transactions
-        if not recent_transactions:
-            return 1.0
-        
-        successful = sum(1 for t in recent_transactions if t["success"])
-        return successful / len(recent_transactions)
+        recent = self.transaction_times.recent("success", 100)  # Last 100 transactions
+        return float(recent.mean())
     
     def _calculate_data_freshness_score(self) -> float:
         """Calculate data freshness score"""
@@ -289,16 +371,11 @@ class AgriMindEvaluator:
     def _calculate_system_load(self) -> float:
         """Calculate current system load"""
         # Simple load calculation based on recent activity
-        current_time = datetime.now()
-        recent_cutoff = current_time - timedelta(minutes=1)
-        
-        recent_operations = [
-            r for r in self.response_times
-            if r["timestamp"] > recent_cutoff
-        ]
+        recent_cutoff = time.time() - 60
+        recent_operations = np.count_nonzero(self.response_times.column("ts") > recent_cutoff)
         
         # Normalize to 0-1 scale (100 operations per minute = load 1.0)
-        return min(1.0, len(recent_operations) / 100.0)
+        return min(1.0, recent_operations / 100.0)
     
     def generate_agent_efficiency_report(self, agent_id: str) -> AgentEfficiencyReport:
         """Generate comprehensive efficiency report for an agent"""
@@ -335,25 +412,21 @@ class AgriMindEvaluator:
     
     def _calculate_agent_transaction_success_rate(self, agent_id: str) -> float:
         """Calculate transaction success rate for an agent"""
-        agent_transactions = [
-            t for t in self.transaction_times
-            if t["buyer_id"] == agent_id or t["seller_id"] == agent_id
-        ]
-        
-        if not agent_transactions:
+        agent_idx = self._agent_index.get(agent_id)
+        count = self._agent_txn_count.get(agent_idx, 0)
+        if not count:
             return 1.0
         
-        successful = sum(1 for t in agent_transactions if t["success"])
-        return successful / len(agent_transactions)
+        return self._agent_txn_success[agent_idx] / count
     
     def _calculate_agent_avg_response_time(self, agent_id: str) -> float:
         """Calculate average response time for an agent"""
-        agent_responses = [
-            r["duration"] for r in self.response_times
-            if r["agent_id"] == agent_id
-        ]
+        agent_idx = self._agent_index.get(agent_id)
+        count = self._agent_resp_count.get(agent_idx, 0)
+        if not count:
+            return 0.0
         
-        return statistics.mean(agent_responses) if agent_responses else 0.0
+        return self._agent_resp_sum[agent_idx] / count
     
     def _calculate_agent_data_quality_score(self, agent_id: str) -> float:
         """Calculate data quality score for an agent"""
@@ -372,20 +445,10 @@ class AgriMindEvaluator:
     
     def _calculate_agent_collaboration_score(self, agent_id: str) -> float:
         """Calculate collaboration score for an agent"""
-        # Score based on number of unique trading partners and transaction volume
-        unique_partners = set()
-        total_interactions = 0
-        
-        if agent_id in self.collaboration_matrix:
-            for partner, data in self.collaboration_matrix[agent_id].items():
-                unique_partners.add(partner)
-                total_interactions += data["count"]
-        
-        # Also check incoming transactions
-        for buyer_id, partners in self.collaboration_matrix.items():
-            if agent_id in partners:
-                unique_partners.add(buyer_id)
-                total_interactions += partners[agent_id]["count"]
+        # Score based on number of unique trading partners and transaction volume,
+        # counting both sides of each trade
+        unique_partners = self._agent_partners.get(agent_id, ())
+        total_interactions = self._agent_interactions.get(agent_id, 0)
         
         # Normalize scores
         partner_score = min(1.0, len(unique_partners) / 5.0)  # Max 5 partners
@@ -426,15 +489,10 @@ class AgriMindEvaluator:
         
         agent = message_bus.agents[agent_id]
         
-        # Calculate net profit from transactions
-        total_income = 0.0
-        total_expenses = 0.0
-        
-        for transaction in self.transaction_times:
-            if transaction["seller_id"] == agent_id:
-                total_income += transaction["value"]
-            elif transaction["buyer_id"] == agent_id:
-                total_expenses += transaction["value"]
+        # Net profit from transactions
+        agent_idx = self._agent_index.get(agent_id)
+        total_income = self._agent_income.get(agent_idx, 0.0)
+        total_expenses = self._agent_expenses.get(agent_idx, 0.0)
         
         if total_income + total_expenses == 0:
             return 0.5  # Neutral score if no transactions
@@ -526,7 +584,7 @@ class AgriMindEvaluator:
             "top_performing_agents": top_agents,
             "system_recommendations": system_recommendations,
             "total_metrics_collected": len(self.metrics_history),
-            "total_transactions_processed": len(self.transaction_times),
+            "total_transactions_processed": self._transactions_recorded,
             "error_summary": self.error_counts
         }
         
@@ -537,7 +595,7 @@ class AgriMindEvaluator:
         if len(self.system_snapshots) < 2:
             return {"status": "insufficient_data"}
         
-        recent_snapshots = self.system_snapshots[-10:]  # Last 10 snapshots
+        recent_snapshots = list(islice(reversed(self.system_snapshots), 10))[::-1]  # Last 10 snapshots
         
         # Calculate trends
         response_time_trend = self._calculate_metric_trend(
@@ -585,15 +643,12 @@ class AgriMindEvaluator:
             return "stable"
         
         # Simple linear regression to determine trend
-        x = list(range(len(values)))
-        n = len(values)
+        y = np.asarray(values, dtype=np.float64)
+        x = np.arange(len(y), dtype=np.float64)
+        n = len(y)
         
-        sum_x = sum(x)
-        sum_y = sum(values)
-        sum_xy = sum(x[i] * values[i] for i in range(n))
-        sum_x2 = sum(xi * xi for xi in x)
-        
-        slope = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x * sum_x)
+        sum_x = x.sum()
+        slope = (n * x.dot(y) - sum_x * y.sum()) / (n * x.dot(x) - sum_x * sum_x)
         
         if slope > 0.01:
             return "increasing"
@@ -718,7 +773,7 @@ class AgriMindEvaluator:
             },
             "metrics": [asdict(metric) for metric in self.metrics_history],
             "system_snapshots": [asdict(snapshot) for snapshot in self.system_snapshots],
-            "transaction_history": self.transaction_times,
+            "transaction_history": self._transaction_history(),
             "collaboration_matrix": self.collaboration_matrix,
             "error_counts": self.error_counts
         }
@@ -733,6 +788,30 @@ class AgriMindEvaluator:
             json.dump(export_data, f, indent=2, default=convert_datetime)
         
         logger.info(f"Metrics exported to {filepath}")
+    
+    def _transaction_history(self) -> List[Dict[str, Any]]:
+        """Rebuild transaction records, oldest first, from the numpy columns"""
+        agent_ids = {idx: agent_id for agent_id, idx in self._agent_index.items()}
+        types = {idx: name for name, idx in self._type_index.items()}
+        transactions = self.transaction_times
+        n = len(transactions)
+        columns = zip(*(
+            transactions.recent(name, n).tolist()
+            for name in ("type_idx", "duration", "success", "buyer_idx", "seller_idx", "value", "ts")
+        ))
+        
+        return [
+            {
+                "type": types[type_idx],
+                "duration": duration,
+                "success": success,
+                "buyer_id": agent_ids[buyer_idx],
+                "seller_id": agent_ids[seller_idx],
+                "value": value,
+                "timestamp": datetime.fromtimestamp(ts)
+            }
+            for type_idx, duration, success, buyer_idx, seller_idx, value, ts in columns
+        ]
 
 # Global evaluator instance
 agrimind_evaluator = AgriMindEvaluator()
\ No newline at end of file